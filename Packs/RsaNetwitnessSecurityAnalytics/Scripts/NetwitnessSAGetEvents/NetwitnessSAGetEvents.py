@@ -13,12 +13,10 @@ def netwitness_im_get_events():
             data = data if isinstance(data, list) else [data]
             formatTimeColumns(data, ['time'])
             for row in data:
-                newMeta = {}
-                for var in row['meta']:
-                    newMeta['meta.' + var['name']] = var['value']
-                row['meta'] = newMeta
+                row['meta'] = {'meta.' + var['name']: var['value'] for var in row['meta']}
                 raiseTable(row, 'meta')
-            data = [{k: formatCell(row[k]) for k in row} for row in data]
+            json_transform = JsonTransformer(flatten=True)
+            data = [{k: formatCell(v, json_transform=json_transform) for k, v in row.items()} for row in data]
             result = {"ContentsFormat": formats["table"], "Type": entryTypes["note"], "Contents": data}
         else:
             result = "No results."
@@ -4,6 +4,8 @@ from CommonServerPython import *  # noqa: F401
 from CommonServerUserPython import *
 import urllib3
 from typing import Any
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 # Disable insecure warnings
 urllib3.disable_warnings()
@@ -16,6 +18,10 @@ VENDOR = 'symantec'
 PRODUCT = 'cloud_soc'
 LOG_TYPES = {"Investigate_logs": {"app": "Investigate", "subtype": "all"},
              "Incident_logs": {"app": "Detect", "subtype": "incidents"}}
+TIMESTAMP_FIELD = {"Investigate_logs": "created_timestamp",
+                   "Incident_logs": "incident_start_time"}
+TYPE_LABEL = {"Investigate_logs": "Investigate",
+              "Incident_logs": "Detect incident"}
 MAX_LIMIT_PER_CALL = 1000
 
 ''' CLIENT CLASS '''
@@ -28,6 +34,8 @@ class Client(BaseClient):
 
     def __init__(self, base_url, verify, proxy, headers):
         super().__init__(base_url=base_url, verify=verify, proxy=proxy, headers=headers)
+        # Mount the retrying adapter once, so the paginated requests keep reusing its pooled connections.
+        self._implement_retry(retries=3, status_list_to_retry=[429, 500, 502, 503, 504], backoff_factor=0.3)
 
     def get_events_request(self, max_fetch: int | None, app: str | None = None, subtype: str | None = None,
                            next_url: str | None = None, created_timestamp: str = None
@@ -78,6 +86,7 @@ def test_module(client: Client) -> str:
         str: 'ok' if test passed, anything else will raise an exception and will fail the test.
     """
     try:
+        now_str = datetime.now(timezone.utc).strftime(DATE_FORMAT)
         for log_type, url_params in LOG_TYPES.items():
             demisto.debug(f'test_module: {log_type}')
             app = url_params.get("app")
@@ -85,7 +94,7 @@ def test_module(client: Client) -> str:
             if app == 'Investigate':
                 client.get_events_request(max_fetch=1, app=app,
                                           subtype=url_params.get("subtype"),
-                                          created_timestamp=datetime.now(timezone.utc).strftime(DATE_FORMAT))
+                                          created_timestamp=now_str)
             else:
                 client.get_events_request(max_fetch=1, app=app, subtype=url_params.get("subtype"))
 
@@ -125,15 +134,22 @@ def get_all_events(client: Client, first_fetch_time: str,
     next_run: dict[str, dict] = {}
     # Initialize an empty next_run object to return
     new_last_run: dict = {}
-    for log_type in LOG_TYPES:
-        log_events, next_run = get_all_events_for_log_type(
-            client=client,
-            log_type=log_type,
-            max_fetch=limit,
-            last_run=last_run,
-            first_fetch_time=first_fetch_time,
-            first_fetch_time_investigate=first_fetch_time_investigate,
-        )
+    # The log types are independent and I/O bound, so they are fetched concurrently.
+    with ThreadPoolExecutor(max_workers=len(LOG_TYPES)) as executor:
+        futures = {
+            log_type: executor.submit(
+                get_all_events_for_log_type,
+                client=client,
+                log_type=log_type,
+                max_fetch=limit,
+                last_run=last_run,
+                first_fetch_time=first_fetch_time,
+                first_fetch_time_investigate=first_fetch_time_investigate,
+            )
+            for log_type in LOG_TYPES
+        }
+    for log_type, future in futures.items():
+        log_events, next_run = future.result()
         demisto.debug(f'SymantecEventCollector: Got {len(log_events)} events from log type: {log_type}')
         if log_type == "Investigate_logs":
             investigate_logs_events.extend(log_events)
@@ -165,33 +181,33 @@ def get_events_command(client: Client, first_fetch_time: str,
     events: list[dict] = []
     investigate_logs_events: list = []
     incident_logs_events: list = []
-    hr = ""
+    hr_parts: list[str] = []
     demisto.debug(f'SymantecEventCollector: last_run is {last_run}')
     investigate_logs_events, incident_logs_events, _ = get_all_events(client, first_fetch_time,
                                                                       first_fetch_time_investigate,
                                                                       last_run, limit)
     if investigate_logs_events:
         events.extend(investigate_logs_events)
-        hr += tableToMarkdown(
+        hr_parts.append(tableToMarkdown(
             name="Investigate Logs Events",
             t=investigate_logs_events,
             headerTransform=string_to_table_header,
             headers=["_id", "user_name", "_domain", "severity", "service", "created_timestamp", "message"],
-        )
+        ))
     else:
-        hr += "No events found for investigate logs.\n"
+        hr_parts.append("No events found for investigate logs.\n")
     if incident_logs_events:
         events.extend(incident_logs_events)
-        hr += tableToMarkdown(
+        hr_parts.append(tableToMarkdown(
             name="Incident Logs Events",
             t=incident_logs_events,
             headerTransform=string_to_table_header,
             headers=["_id", "message", "incident_start_time", "service", "hosts", "locations", "severity"],
-        )
+        ))
     else:
-        hr += "No events found for incident logs.\n"
+        hr_parts.append("No events found for incident logs.\n")
 
-    return events, CommandResults(readable_output=hr, raw_response=events)
+    return events, CommandResults(readable_output="".join(hr_parts), raw_response=events)
 
 
 def add_fields_to_event(event: dict, log_type: str) -> None:
@@ -203,12 +219,8 @@ def add_fields_to_event(event: dict, log_type: str) -> None:
         list: The events with the _time and type keys.
     """
     if event:
-        if log_type == "Incident_logs":
-            event['_time'] = event.get('incident_start_time')
-            event['type'] = "Detect incident"
-        elif log_type == "Investigate_logs":
-            event['_time'] = event.get('created_timestamp')
-            event['type'] = "Investigate"
+        event['_time'] = event.get(TIMESTAMP_FIELD[log_type])
+        event['type'] = TYPE_LABEL[log_type]
 
 
 def get_date_timestamp(str_date: str) -> datetime:
@@ -220,14 +232,16 @@ def get_date_timestamp(str_date: str) -> datetime:
     Returns:
         - (datetime) A date.
     """
-    return datetime.strptime(str_date, DATE_FORMAT_SYMANTEC)
+    # DATE_FORMAT_SYMANTEC is ISO-8601, so fromisoformat parses it much faster than strptime.
+    return datetime.fromisoformat(str_date)
 
 
-def dedup_by_id(last_run: dict, events: list, log_type: str, limit: int,
-                number_of_events: int, last_fetch: str) -> tuple[list, dict]:
+def dedup_by_id_iter(last_run: dict, events: list, log_type: str, limit: int,
+                     number_of_events: int, last_fetch: str, new_last_run: dict) -> Iterator[dict]:
     """
     Dedup mechanism for the fetch to check both log_id and created_timestamp/incident_start_time
-    (since timestamp can be duplicate)
+    (since timestamp can be duplicate). Yields the accepted events one by one so callers can collect
+    them without building an intermediate list per page.
     Args:
         last_run (dict): Last run.
         events (list): List of the events from the API.
@@ -235,49 +249,52 @@ def dedup_by_id(last_run: dict, events: list, log_type: str, limit: int,
         limit (int): The number of events to return.
         number_of_events (int): The number of event we already fetched
         last_fetch (str): Last fetch time.
-    Returns:
-        - list of events to send to XSIAM.
-        - The new last_run (dictionary with the relevant timestamps and the events ids).
-        - The new last_run timestamps.
+        new_last_run (dict): Filled in place with the new last_run (the relevant timestamps and the events ids)
+            once the generator is exhausted.
+    Yields:
+        - The events to send to XSIAM.
     """
-    last_run_ids = dict_safe_get(last_run, [f'{log_type}-ids'], default_return_value=[])
-    last_run_time = dict_safe_get(last_run, ["last_run"]) or last_fetch
-    new_events: list = []
+    # A dict keeps the ids ordered for last_run while giving constant-time membership checks.
+    last_run_ids = dict.fromkeys(last_run.get(f'{log_type}-ids', []))
+    last_run_time = last_run.get("last_run") or last_fetch
+    number_of_new_events = 0
     new_events_ids = []
-    new_last_run: dict = {}
     new_last_run_time: str = last_run_time
-    new_last_run_time_date = get_date_timestamp(new_last_run_time)
+    last_run_time_date = get_date_timestamp(last_run_time)
+    new_last_run_time_date = last_run_time_date
+    remaining = limit - number_of_events
+    timestamp_field = TIMESTAMP_FIELD[log_type]
     # The logs sort by asc by default
     if events:
         for event in events:
-            if len(new_events) + number_of_events < limit:
-                event_timestamp = (event.get("incident_start_time")
-                                   if log_type == "Incident_logs"
-                                   else event.get("created_timestamp"))  # log type is Investigate_logs
-                event_id = event.get('_id')
-                # The event we are looking at has the same timestamp as previously fetched events
-                if event_timestamp == last_run_time:
-                    if event_id not in set(last_run_ids):
-                        new_events.append(event)
-                        last_run_ids.append(event_id)
-                # The event has a timestamp we have not yet fetched meaning it is a new event
+            if number_of_new_events >= remaining:
+                break
+            event_timestamp = event.get(timestamp_field)
+            event_id = event.get('_id')
+            # The event we are looking at has the same timestamp as previously fetched events
+            if event_timestamp == last_run_time:
+                if event_id in last_run_ids:
+                    continue
+                last_run_ids[event_id] = None
+            # The event has a timestamp we have not yet fetched meaning it is a new event
+            else:
+                new_events_ids.append(event_id)
+                # If the event has a timestamp newer than the saved one, we will update the last run to the
+                # current event time. The logs are sorted, so a timestamp equal to the newest one is not parsed again.
+                event_timestamp_date = (new_last_run_time_date if event_timestamp == new_last_run_time
+                                        else get_date_timestamp(event_timestamp))
+                if new_last_run_time_date < event_timestamp_date:
+                    new_last_run_time = event_timestamp
+                    new_last_run_time_date = event_timestamp_date
                 else:
-                    new_events.append(event)
-                    new_events_ids.append(event_id)
-                    # If the event has a timestamp newer than the saved one, we will update the last run to the
-                    # current event time
-                    event_timestamp_date = get_date_timestamp(event_timestamp)
-                    if new_last_run_time_date < event_timestamp_date:
-                        new_last_run_time = event_timestamp
-                    else:
-                        demisto.debug(f'SymantecEventCollector: new_last_run_time is {new_last_run_time}'
-                                      f'event_timestamp is {event_timestamp} and command is {demisto.command()}')
-                new_last_run_time_date = get_date_timestamp(new_last_run_time)
-                add_fields_to_event(event, log_type)
+                    demisto.debug(f'SymantecEventCollector: new_last_run_time is {new_last_run_time}'
+                                  f'event_timestamp is {event_timestamp} and command is {demisto.command()}')
+            add_fields_to_event(event, log_type)
+            number_of_new_events += 1
+            yield event
 
         # If we have received events with a newer time (new_event_ids list) we save them,
         # otherwise we save the list that include the old ids together with the new event ids (last_run_ids).
-        last_run_time_date = get_date_timestamp(last_run_time)
         if (last_run_time_date < new_last_run_time_date) and new_events_ids:
             new_last_run[f'{log_type}-ids'] = new_events_ids
         else:
@@ -289,6 +306,26 @@ def dedup_by_id(last_run: dict, events: list, log_type: str, limit: int,
     elif last_run_time:
         new_last_run["last_run"] = last_run_time
     demisto.debug(f'SymantecEventCollector: Setting new last run - {new_last_run} for {log_type}')
+
+
+def dedup_by_id(last_run: dict, events: list, log_type: str, limit: int,
+                number_of_events: int, last_fetch: str) -> tuple[list, dict]:
+    """
+    Dedup mechanism for the fetch to check both log_id and created_timestamp/incident_start_time
+    (since timestamp can be duplicate)
+    Args:
+        last_run (dict): Last run.
+        events (list): List of the events from the API.
+        log_type (str): the log type.
+        limit (int): The number of events to return.
+        number_of_events (int): The number of event we already fetched
+        last_fetch (str): Last fetch time.
+    Returns:
+        - list of events to send to XSIAM.
+        - The new last_run (dictionary with the relevant timestamps and the events ids).
+    """
+    new_last_run: dict = {}
+    new_events = list(dedup_by_id_iter(last_run, events, log_type, limit, number_of_events, last_fetch, new_last_run))
     return new_events, new_last_run
 
 
@@ -309,10 +346,10 @@ def get_all_events_for_log_type(client: Client, max_fetch: int, log_type: str, l
     demisto.debug(f'SymantecEventCollector: last_run is {last_run}')
     next_url: str | None = ''
     all_events_list: list = []
-    subtype = dict_safe_get(LOG_TYPES, [log_type, "subtype"])
-    app = dict_safe_get(LOG_TYPES, [log_type, "app"])
-    last_fetch = dict_safe_get(last_run, [log_type, "last_run"])
-    last_run_for_log_type = dict_safe_get(last_run, [log_type])
+    subtype = LOG_TYPES[log_type]["subtype"]
+    app = LOG_TYPES[log_type]["app"]
+    last_run_for_log_type = last_run.get(log_type, {})
+    last_fetch = last_run_for_log_type.get("last_run")
     if not last_fetch:
         last_fetch = first_fetch_time_investigate if log_type == "Investigate_logs" else first_fetch_time
         demisto.debug(f"SymantecEventCollector: last_fetch {last_fetch}; for log type: {log_type}")
@@ -324,9 +361,10 @@ def get_all_events_for_log_type(client: Client, max_fetch: int, log_type: str, l
             app=app,
             created_timestamp=last_fetch,
             next_url=next_url)
-        list_of_events, last_run_for_log_type = dedup_by_id(last_run_for_log_type, log_events, log_type,
-                                                            max_fetch, number_of_events, last_fetch)
-        all_events_list.extend(list_of_events)
+        new_last_run_for_log_type: dict = {}
+        all_events_list.extend(dedup_by_id_iter(last_run_for_log_type, log_events, log_type, max_fetch,
+                                                number_of_events, last_fetch, new_last_run_for_log_type))
+        last_run_for_log_type = new_last_run_for_log_type
     demisto.debug(f'SymantecEventCollector: last_run is {last_run}')
     return all_events_list, last_run_for_log_type
 
@@ -378,8 +416,7 @@ def create_client_with_authorization(base_url: str, verify_certificate: bool,
     Returns:
         Client: Client class to interact with Symantec Cloud SOC service API.
     """
-    credentials = f'{key_id}:{key_secret}'
-    encoded_credentials = base64.b64encode(credentials.encode()).decode()
+    encoded_credentials = base64.b64encode(f'{key_id}:{key_secret}'.encode()).decode()
     headers = {
         'Authorization': f'Basic {encoded_credentials}',
         'X-Elastica-Dbname-Resolved': 'True'
@@ -401,12 +438,19 @@ def get_first_fetch_time(params: dict) -> tuple[str, str]:
     """
     # How much time before the first fetch to retrieve events
     first_fetch = params.get('first_fetch', '3 days')
-    first_fetch_time: datetime = arg_to_datetime(arg=first_fetch,
-                                                 arg_name='First fetch time',
-                                                 required=True)  # type: ignore[assignment]
+    first_fetch_time: datetime
+    try:
+        # ISO-8601 values don't need dateparser, which is only required for relative values such as '3 days'.
+        first_fetch_time = datetime.fromisoformat(first_fetch)
+        if first_fetch_time.tzinfo:
+            first_fetch_time = first_fetch_time.astimezone(timezone.utc).replace(tzinfo=None)
+    except (TypeError, ValueError):
+        first_fetch_time = arg_to_datetime(arg=first_fetch,
+                                           arg_name='First fetch time',
+                                           required=True)  # type: ignore[assignment]
     first_fetch_str = first_fetch_time.strftime(DATE_FORMAT_SYMANTEC)
     # API limitation for created_timestamp is 6 months.
-    days_ago_limitation: datetime = dateparser.parse('180 days', settings={'TIMEZONE': 'UTC'})  # type: ignore[assignment]
+    days_ago_limitation = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=180)
     demisto.debug(f'SymantecEventCollector: first fetch time: {first_fetch_time}')
     # For investigate app type the created_timestamp must be less than 6 months.
     first_fetch_time_investigate: datetime = first_fetch_time
@@ -467,7 +511,7 @@ def main() -> None:
                 demisto.debug(f'SymantecEventCollector: last_run in the fetch_events_command is {last_run}')
                 next_run, events = fetch_events_command(
                     client=client,
-                    max_fetch=arg_to_number(max_fetch) or MAX_LIMIT_PER_CALL,
+                    max_fetch=max_fetch,
                     first_fetch_time=first_fetch_time,
                     first_fetch_time_investigate=first_fetch_time_investigate,
                     last_run=last_run,
@@ -1,6 +1,5 @@
 import argparse
 import sys
-from pathlib import Path
 
 PROTECTED_DIRECTORIES = {
     ".circleci",
@@ -23,16 +22,18 @@ EXCEPTIONS = {
 }
 
 
+def get_protected_files(changed_files: list[str]) -> list[str]:
+    first_level_folders = [changed_file.split("/", 1)[0] for changed_file in changed_files]
+    return [changed_file for changed_file, first_level_folder in zip(changed_files, first_level_folders)
+            if first_level_folder in PROTECTED_DIRECTORIES and changed_file not in EXCEPTIONS]
+
+
 def main(changed_files):
-    found_files = []
     # Check if any protected directories have been modified
-    for changed_file in changed_files:
-        changed_path = Path(changed_file)
-        top_level_directory = changed_path.parents[1]
-        if top_level_directory.name in PROTECTED_DIRECTORIES and changed_file not in EXCEPTIONS:
-            print(f"Error: Contribution branch includes changes to files under {top_level_directory}, "
-                  f"which is a protected directory. Please revert them. (file: {changed_file})")
-            found_files.append(changed_file)
+    found_files = get_protected_files(changed_files)
+    for changed_file in found_files:
+        print(f"Error: Contribution branch includes changes to files under {changed_file.split('/', 1)[0]}, "
+              f"which is a protected directory. Please revert them. (file: {changed_file})")
     if found_files:
         sys.exit(1)
     else:
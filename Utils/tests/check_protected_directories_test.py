@@ -0,0 +1,46 @@
+import pytest
+
+from Utils.check_protected_directories import get_protected_files, main
+
+
+def test_get_protected_files():
+    """
+    Given
+    - A list of changed file paths, some of them under protected first-level directories.
+
+    When
+    - Running get_protected_files on it.
+
+    Then
+    - Only paths under a protected first-level directory are returned, unless they are listed as exceptions.
+    """
+    changed_files = [
+        'Packs/HelloWorld/Integrations/HelloWorld/HelloWorld.py',
+        'Packs/HelloWorld/Tests/test_data/sample.json',
+        'README.md',
+        'Tests/conf.json',
+        'Tests/scripts/collect_tests.py',
+        'Utils/check_protected_directories.py',
+        '.github/workflows/check.yml',
+    ]
+    assert get_protected_files(changed_files) == [
+        'Tests/scripts/collect_tests.py',
+        'Utils/check_protected_directories.py',
+        '.github/workflows/check.yml',
+    ]
+
+
+def test_main_exits_on_protected_change():
+    """
+    Given
+    - A list of changed files that includes a file under a protected directory.
+
+    When
+    - Running main.
+
+    Then
+    - The script exits with a non-zero exit code.
+    """
+    with pytest.raises(SystemExit) as e:
+        main(['Packs/HelloWorld/README.md', 'Templates/Integrations/Template.py'])
+    assert e.value.code == 1